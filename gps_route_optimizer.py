@@ -1,10 +1,45 @@
 #!/usr/bin/env python3
 
 import math
-import itertools
 import argparse
+import heapq
+import os
 import sys
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from itertools import repeat
+from typing import List, Optional, Sequence, Tuple
+
+# Rows of single-precision distances in kilometers, see build_distance_matrix
+DistanceMatrix = List[Sequence[float]]
+
+# Radius of earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+# Above this many points the Held-Karp tables get too large and brute force
+# switches to branch and bound
+HELD_KARP_MAX_POINTS = 16
+
+# Above this many points nearest neighbor skips the O(n^2) distance matrix
+SPATIAL_INDEX_THRESHOLD = 2000
+
+# Heuristic solvers use build_distance_matrix_fast when every point is this close to the others
+FAST_DISTANCE_MAX_SPREAD_KM = 2000.0
+
+# Number of nearest neighbor starts the 2opt local search is run from; fixed so
+# the same input gives the same route on any machine
+MULTI_START_COUNT = 4
+
+# Below this many points a local search finishes before a process pool starts up
+PARALLEL_THRESHOLD = 200
+
+# Bound once so the per-call distance math skips the module attribute lookups
+_radians = math.radians
+_sin = math.sin
+_cos = math.cos
+_asin = math.asin
+_atan2 = math.atan2
+_sqrt = math.sqrt
 
 def haversine_distance(coord1: Tuple[float, float], coord2: Tuple[float, float]) -> float:
     """
@@ -17,49 +52,671 @@ def haversine_distance(coord1: Tuple[float, float], coord2: Tuple[float, float])
     Returns:
         Distance in kilometers
     """
-    lat1, lon1 = coord1
-    lat2, lon2 = coord2
-    
     # Convert latitude and longitude from degrees to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    lat1 = _radians(coord1[0])
+    lon1 = _radians(coord1[1])
+    lat2 = _radians(coord2[0])
+    lon2 = _radians(coord2[1])
     
     # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    sin_dlat = _sin((lat2 - lat1) * 0.5)
+    sin_dlon = _sin((lon2 - lon1) * 0.5)
+    a = sin_dlat * sin_dlat + _cos(lat1) * _cos(lat2) * sin_dlon * sin_dlon
+    if a > 1.0:
+        a = 1.0  # Rounding can overshoot for antipodal points, and 1.0 - a must not go negative
+    
+    # atan2 stays accurate near antipodal points, where asin(sqrt(a)) loses precision
+    return 2.0 * EARTH_RADIUS_KM * _atan2(_sqrt(a), _sqrt(1.0 - a))
+
+def build_distance_matrix(coordinates: List[Tuple[float, float]]) -> DistanceMatrix:
+    """
+    Precompute the pairwise Haversine distance between every pair of coordinates.
+    
+    The solvers look up edge lengths in this table instead of recomputing the
+    trigonometry for the same pair over and over. Rows are stored as float32
+    arrays: the solvers only compare distances, sub-meter rounding does not
+    change their decisions, and it takes a fraction of the memory of lists.
+    
+    Args:
+        coordinates: List of GPS coordinates as (latitude, longitude) tuples
+    
+    Returns:
+        Symmetric N x N matrix where entry [i][j] is the distance in kilometers
+        between coordinates[i] and coordinates[j]
+    """
+    n = len(coordinates)
+    lats = [_radians(lat) for lat, _ in coordinates]
+    lons = [_radians(lon) for _, lon in coordinates]
+    cos_lats = [_cos(lat) for lat in lats]
+    
+    matrix = [array('f', [0.0]) * n for _ in range(n)]
+    for i in range(n):
+        row = matrix[i]
+        lat1, lon1, cos_lat1 = lats[i], lons[i], cos_lats[i]
+        for j in range(i + 1, n):
+            sin_dlat = _sin((lats[j] - lat1) * 0.5)
+            sin_dlon = _sin((lons[j] - lon1) * 0.5)
+            a = sin_dlat * sin_dlat + cos_lat1 * cos_lats[j] * sin_dlon * sin_dlon
+            distance = 2.0 * EARTH_RADIUS_KM * _asin(_sqrt(a))
+            row[j] = distance
+            matrix[j][i] = distance
+    
+    return matrix
+
+def _cartesian_points(coordinates: List[Tuple[float, float]]) -> List[Tuple[float, float, float]]:
+    """
+    Convert coordinates to (x, y, z) positions in kilometers relative to the Earth's center.
+    """
+    points = []
+    for lat, lon in coordinates:
+        lat = _radians(lat)
+        lon = _radians(lon)
+        horizontal = EARTH_RADIUS_KM * _cos(lat)
+        points.append((horizontal * _cos(lon), horizontal * _sin(lon), EARTH_RADIUS_KM * _sin(lat)))
+    return points
+
+def _spread_km(coordinates: List[Tuple[float, float]]) -> float:
+    """
+    Return an upper bound on the straight-line distance between any two coordinates.
+    """
+    points = _cartesian_points(coordinates)
+    n = len(points)
+    center = tuple(sum(axis) / n for axis in zip(*points))
+    return 2.0 * max(math.dist(center, point) for point in points)
+
+def build_distance_matrix_fast(coordinates: List[Tuple[float, float]]) -> DistanceMatrix:
+    """
+    Precompute approximate pairwise distances without any per-pair trigonometry.
     
-    # Radius of earth in kilometers
-    r = 6371
+    Each entry is the straight-line (chord) distance through the Earth, which
+    grows monotonically with great-circle distance and falls short of it by
+    about d^2 / (24 r^2) relative, under 0.5% for points within
+    FAST_DISTANCE_MAX_SPREAD_KM of each other. That is accurate enough for the
+    heuristic solvers to compare routes, and math.dist runs the whole row in C.
     
-    return c * r
+    Args:
+        coordinates: List of GPS coordinates as (latitude, longitude) tuples
+    
+    Returns:
+        Symmetric N x N matrix where entry [i][j] is the approximate distance in
+        kilometers between coordinates[i] and coordinates[j]
+    """
+    points = _cartesian_points(coordinates)
+    dist = math.dist
+    return [array('f', map(dist, repeat(point), points)) for point in points]
 
-def calculate_total_distance(route: List[Tuple[float, float]]) -> float:
+def calculate_total_distance(route: Sequence, distance_matrix: Optional[DistanceMatrix] = None) -> float:
     """
     Calculate the total distance for a complete route (including return to start).
     
     Args:
-        route: List of GPS coordinates in order
+        route: List of GPS coordinates in order, or list of indices into
+            distance_matrix when one is given
+        distance_matrix: Optional precomputed matrix from build_distance_matrix
     
     Returns:
         Total distance in kilometers
     """
-    total_distance = 0.0
+    if not route:
+        return 0.0
     
-    # Calculate distance between consecutive points
-    for i in range(len(route)):
-        current_point = route[i]
-        next_point = route[(i + 1) % len(route)]  # Use modulo for circular route
-        total_distance += haversine_distance(current_point, next_point)
+    # Pair each point with the next, then add the edge back to the start once
+    # instead of wrapping every index with a modulo
+    if distance_matrix is not None:
+        total_distance = distance_matrix[route[-1]][route[0]]
+        total_distance += sum([distance_matrix[a][b] for a, b in zip(route, route[1:])])
+    else:
+        total_distance = haversine_distance(route[-1], route[0])
+        total_distance += sum(map(haversine_distance, route, route[1:]))
     
     return total_distance
 
-def find_shortest_route_brute_force(coordinates: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+def _held_karp_order(distance_matrix: DistanceMatrix) -> List[int]:
+    """
+    Return the optimal visiting order as indices using Held-Karp dynamic programming.
+    
+    Runs in O(n^2 * 2^n) time instead of the O(n!) of trying every permutation.
+    """
+    n = len(distance_matrix)
+    if n <= 2:
+        return list(range(n))
+    
+    # The route is fixed to start at index 0, so subsets only cover points 1..n-1.
+    # cost[mask][j] is the shortest path from point 0 through the points in mask,
+    # ending at point j + 1.
+    m = n - 1
+    full_mask = (1 << m) - 1
+    inf = float('inf')
+    cost = [[inf] * m for _ in range(1 << m)]
+    parent = [[-1] * m for _ in range(1 << m)]
+    
+    for j in range(m):
+        cost[1 << j][j] = distance_matrix[0][j + 1]
+    
+    # Distances between points 1..n-1, re-indexed to match the bit positions
+    rows = [row[1:] for row in distance_matrix[1:]]
+    
+    # Every subset is numerically larger than its own subsets,
+    # so plain increasing order visits masks in a valid order
+    for mask in range(1, full_mask):
+        mask_cost = cost[mask]
+        outside = [(nxt, mask | (1 << nxt)) for nxt in range(m) if not mask & (1 << nxt)]
+        for last in range(m):
+            last_cost = mask_cost[last]
+            if last_cost == inf:
+                continue
+            last_row = rows[last]
+            for nxt, new_mask in outside:
+                new_cost = last_cost + last_row[nxt]
+                if new_cost < cost[new_mask][nxt]:
+                    cost[new_mask][nxt] = new_cost
+                    parent[new_mask][nxt] = last
+    
+    # Close the loop back to the starting point
+    last = min(range(m), key=lambda j: cost[full_mask][j] + distance_matrix[j + 1][0])
+    
+    order = []
+    mask = full_mask
+    while last != -1:
+        order.append(last + 1)
+        mask, last = mask ^ (1 << last), parent[mask][last]
+    order.append(0)
+    order.reverse()
+    
+    return order
+
+def _branch_and_bound_order(distance_matrix: DistanceMatrix) -> List[int]:
+    """
+    Return the optimal visiting order as indices using depth-first branch and bound.
+    
+    Used where the Held-Karp tables would not fit in memory. Partial routes are
+    extended nearest point first and abandoned as soon as they cannot beat the
+    best complete route found so far, which starts out as the 2-opt/Or-opt
+    result. The rest of any completion has to connect the unvisited points,
+    enter them from the current point and return to the start, so a minimum
+    spanning tree of the unvisited points plus the cheapest such entry and
+    exit edges bounds it from below.
+    """
+    n = len(distance_matrix)
+    
+    best_order = _local_search_order(_nearest_neighbor_order(distance_matrix), distance_matrix)
+    first = best_order.index(0)
+    best_order = best_order[first:] + best_order[:first]
+    best = [calculate_total_distance(best_order, distance_matrix), best_order]
+    
+    nearest_first = [sorted(range(1, n), key=row.__getitem__) for row in distance_matrix]
+    visited = [False] * n
+    visited[0] = True
+    path = [0]
+    
+    def spanning_tree_length(points: List[int]) -> float:
+        # Prim's algorithm over the given points
+        link_cost = {p: distance_matrix[points[0]][p] for p in points[1:]}
+        total = 0.0
+        while link_cost:
+            p = min(link_cost, key=link_cost.__getitem__)
+            total += link_cost.pop(p)
+            row = distance_matrix[p]
+            for q in link_cost:
+                if row[q] < link_cost[q]:
+                    link_cost[q] = row[q]
+        return total
+    
+    def search(current: int, length: float):
+        if len(path) == n:
+            total = length + distance_matrix[current][0]
+            if total < best[0]:
+                best[0] = total
+                best[1] = path.copy()
+            return
+        
+        row = distance_matrix[current]
+        for nxt in nearest_first[current]:
+            if visited[nxt]:
+                continue
+            new_length = length + row[nxt]
+            if new_length >= best[0]:
+                break  # Later candidates are farther away still
+            
+            visited[nxt] = True
+            rest = [p for p in range(n) if not visited[p]]
+            if rest:
+                nxt_row = distance_matrix[nxt]
+                bound = (new_length + spanning_tree_length(rest)
+                         + min(nxt_row[p] for p in rest)
+                         + min(distance_matrix[p][0] for p in rest))
+            else:
+                bound = new_length + distance_matrix[nxt][0]
+            
+            if bound < best[0]:
+                path.append(nxt)
+                search(nxt, new_length)
+                path.pop()
+            visited[nxt] = False
+    
+    search(0, 0.0)
+    
+    return best[1]
+
+def _nearest_neighbor_order(distance_matrix: DistanceMatrix, start: int = 0) -> List[int]:
+    """
+    Return a nearest neighbor visiting order as indices, beginning at index start.
+    """
+    n = len(distance_matrix)
+    unvisited = [i for i in range(n) if i != start]
+    order = [start]
+    current = start
+    
+    for _ in range(n - 1):
+        # Scan the precomputed row of the current point; the key lookup and the
+        # reduction both run in C, so no distances are recomputed here
+        nearest = min(unvisited, key=distance_matrix[current].__getitem__)
+        order.append(nearest)
+        unvisited.remove(nearest)
+        current = nearest
+    
+    return order
+
+def _grid_nearest_neighbor_order(coordinates: List[Tuple[float, float]], start: int = 0) -> List[int]:
+    """
+    Return a nearest neighbor visiting order (as indices) without a distance matrix.
+    
+    Points are projected onto an equirectangular plane around their mean
+    latitude and bucketed into a uniform grid. Each step searches outward ring
+    by ring from the current point's cell, so finding the nearest unvisited
+    point touches a handful of cells instead of every point, and memory stays
+    O(n). Planar distance is only an approximation of great-circle distance,
+    which is fine for a seed route over a regional dataset.
+    """
+    n = len(coordinates)
+    mean_lat = _radians(sum(lat for lat, _ in coordinates) / n)
+    x_scale = EARTH_RADIUS_KM * _cos(mean_lat)
+    xs = [x_scale * _radians(lon) for _, lon in coordinates]
+    ys = [EARTH_RADIUS_KM * _radians(lat) for lat, _ in coordinates]
+    
+    # Size cells to hold about two points each on average
+    width = max(xs) - min(xs)
+    height = max(ys) - min(ys)
+    if width > 0 and height > 0:
+        cell = _sqrt(2.0 * width * height / n)
+    else:
+        cell = 2.0 * (width + height) / n or 1.0
+    
+    buckets = {}
+    cell_of = []
+    for i in range(n):
+        key = (int(xs[i] // cell), int(ys[i] // cell))
+        buckets.setdefault(key, []).append(i)
+        cell_of.append(key)
+    
+    def visit(i: int):
+        bucket = buckets[cell_of[i]]
+        bucket.remove(i)
+        if not bucket:
+            del buckets[cell_of[i]]
+    
+    visit(start)
+    order = [start]
+    current = start
+    
+    for _ in range(n - 1):
+        x, y = xs[current], ys[current]
+        cx, cy = cell_of[current]
+        nearest = -1
+        nearest_distance = float('inf')
+        ring = 0
+        
+        while True:
+            # Once the ring spans more cells than are still occupied, scanning those is cheaper
+            scan_all = (2 * ring + 1) ** 2 >= len(buckets)
+            if scan_all:
+                candidates = buckets.values()
+            elif ring == 0:
+                candidates = [buckets.get((cx, cy), ())]
+            else:
+                keys = [(cx + dx, cy + dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+                keys += [(cx + dx, cy + dy) for dx in (-ring, ring) for dy in range(1 - ring, ring)]
+                candidates = [buckets[key] for key in keys if key in buckets]
+            
+            for bucket in candidates:
+                for i in bucket:
+                    dx = xs[i] - x
+                    dy = ys[i] - y
+                    distance = dx * dx + dy * dy
+                    if distance < nearest_distance:
+                        nearest_distance = distance
+                        nearest = i
+            
+            # Points in cells beyond this ring are at least ring * cell away
+            if scan_all or (nearest != -1 and nearest_distance <= (ring * cell) ** 2):
+                break
+            ring += 1
+        
+        visit(nearest)
+        order.append(nearest)
+        current = nearest
+    
+    return order
+
+def _christofides_order(distance_matrix: DistanceMatrix) -> List[int]:
+    """
+    Return a visiting order (as indices) built with Christofides' construction.
+    
+    Steps: build a minimum spanning tree, match up its odd-degree vertices,
+    walk an Eulerian circuit of the combined multigraph, and shortcut points
+    that were already visited. The odd vertices are matched greedily by
+    shortest edge instead of with an exact minimum-weight perfect matching,
+    which keeps this dependency-free at the cost of the formal 3/2 bound.
+    """
+    n = len(distance_matrix)
+    inf = float('inf')
+    
+    # Minimum spanning tree with Prim's algorithm, O(n^2) over the dense matrix
+    in_tree = [False] * n
+    best_cost = [inf] * n
+    best_link = [-1] * n
+    best_cost[0] = 0.0
+    edges = []
+    for _ in range(n):
+        u = min((i for i in range(n) if not in_tree[i]), key=best_cost.__getitem__)
+        in_tree[u] = True
+        if best_link[u] != -1:
+            edges.append((best_link[u], u))
+        row = distance_matrix[u]
+        for v in range(n):
+            if not in_tree[v] and row[v] < best_cost[v]:
+                best_cost[v] = row[v]
+                best_link[v] = u
+    
+    # Vertices with odd degree in the tree; there is always an even number of them
+    degree = [0] * n
+    for u, v in edges:
+        degree[u] += 1
+        degree[v] += 1
+    odd = [i for i in range(n) if degree[i] % 2]
+    
+    # Pair up the odd vertices, shortest available edge first
+    pairs = sorted(((distance_matrix[u][v], u, v) for k, u in enumerate(odd) for v in odd[k + 1:]))
+    matched = [False] * n
+    for _, u, v in pairs:
+        if not matched[u] and not matched[v]:
+            matched[u] = matched[v] = True
+            edges.append((u, v))
+    
+    # Eulerian circuit of tree + matching (every degree is now even), via Hierholzer
+    adjacency = [[] for _ in range(n)]
+    for edge_id, (u, v) in enumerate(edges):
+        adjacency[u].append((v, edge_id))
+        adjacency[v].append((u, edge_id))
+    used = [False] * len(edges)
+    stack = [0]
+    circuit = []
+    while stack:
+        u = stack[-1]
+        while adjacency[u] and used[adjacency[u][-1][1]]:
+            adjacency[u].pop()
+        if adjacency[u]:
+            v, edge_id = adjacency[u].pop()
+            used[edge_id] = True
+            stack.append(v)
+        else:
+            circuit.append(stack.pop())
+    
+    # Shortcut: keep the first visit to each point
+    visited = [False] * n
+    order = []
+    for u in circuit:
+        if not visited[u]:
+            visited[u] = True
+            order.append(u)
+    
+    return order
+
+def _neighbor_lists(distance_matrix: DistanceMatrix, count: int = 20) -> List[List[int]]:
+    """
+    Return, for every point, the indices of its count nearest other points, closest first.
+    """
+    n = len(distance_matrix)
+    k = min(count, n - 1)
+    return [[c for c in heapq.nsmallest(k + 1, range(n), key=row.__getitem__) if c != city][:k]
+            for city, row in enumerate(distance_matrix)]
+
+def _two_opt_order(order: List[int], distance_matrix: DistanceMatrix, max_iterations: int = 1000,
+                   neighbors: Optional[List[List[int]]] = None) -> List[int]:
+    """
+    Improve a visiting order (as indices) using the 2-opt algorithm.
+    
+    A 2-opt move replaces two edges (a, b) and (c, d) with (a, c) and (b, d)
+    by reversing the path between them, and is scored in O(1) from those four
+    distances. Moves are only tried where the new edge (a, c) joins a to one of
+    its nearest points from neighbors and is shorter than the edge it replaces,
+    and each point carries a "don't look" flag that is set when no move from it
+    helps and cleared when one of its edges changes. One iteration is a pass
+    over the points whose flag is clear.
+    """
+    route = order.copy()
+    n = len(route)
+    if n < 4:
+        return route
+    
+    position = [0] * n
+    for i, city in enumerate(route):
+        position[city] = i
+    
+    if neighbors is None:
+        neighbors = _neighbor_lists(distance_matrix)
+    
+    def reverse(i: int, j: int):
+        # Reverse the cyclic path from position i forward to position j, or the
+        # complementary path when that is shorter; both give the same tour
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            u, v = route[i], route[j]
+            route[i], route[j] = v, u
+            position[v], position[u] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+    
+    dont_look = [False] * n
+    
+    for iteration in range(max_iterations):
+        active = [city for city in route if not dont_look[city]]
+        if not active:
+            break
+        
+        for a in active:
+            row_a = distance_matrix[a]
+            improved = False
+            
+            for step in (1, -1):
+                # b follows a in this direction, d follows c
+                i = position[a]
+                b = route[(i + step) % n]
+                d_ab = row_a[b]
+                for c in neighbors[a]:
+                    d_ac = row_a[c]
+                    if d_ac >= d_ab:
+                        break  # Neighbors are sorted, no later c can gain either
+                    j = position[c]
+                    d = route[(j + step) % n]
+                    if c == b or d == a:
+                        continue
+                    if d_ac + distance_matrix[b][d] < d_ab + distance_matrix[c][d] - 1e-12:
+                        if step == 1:
+                            reverse((i + 1) % n, j)
+                        else:
+                            reverse(j, (i - 1) % n)
+                        for city in (a, b, c, d):
+                            dont_look[city] = False
+                        improved = True
+                        break
+                if improved:
+                    break
+            
+            if not improved:
+                dont_look[a] = True
+    
+    return route
+
+def _or_opt_order(order: List[int], distance_matrix: DistanceMatrix, max_iterations: int = 1000,
+                  neighbors: Optional[List[List[int]]] = None) -> Tuple[List[int], bool]:
+    """
+    Improve a visiting order (as indices) by relocating chains of 1 to 3 points.
+    
+    Moving the chain s..e from between p and x to between c and d swaps the
+    edges (p, s), (e, x), (c, d) for (p, x), (c, s), (e, d), or (c, e), (s, d)
+    when the chain is reversed, so each move is scored in O(1). The new slot
+    must sit next to one of the nearest points of s or e, reached over an
+    edge shorter than what removing the chain saves. One iteration is a pass
+    over every chain start.
+    
+    Returns:
+        Tuple of (improved order, whether any move was applied)
+    """
+    route = order.copy()
+    n = len(route)
+    if n < 5:
+        return route, False
+    
+    if neighbors is None:
+        neighbors = _neighbor_lists(distance_matrix)
+    
+    position = [0] * n
+    for i, city in enumerate(route):
+        position[city] = i
+    
+    any_improved = False
+    
+    for iteration in range(max_iterations):
+        improved = False
+        
+        for length in (1, 2, 3):
+            for i in range(n):
+                s, e = route[i], route[(i + length - 1) % n]
+                p, x = route[i - 1], route[(i + length) % n]
+                removal_gain = (distance_matrix[p][s] + distance_matrix[e][x]
+                                - distance_matrix[p][x])
+                
+                best_delta = -1e-12
+                best_move = None
+                for end, other, reverse_if_before in ((s, e, False), (e, s, True)):
+                    row_end = distance_matrix[end]
+                    for y in neighbors[end]:
+                        d_end_y = row_end[y]
+                        if d_end_y >= removal_gain:
+                            break  # Neighbors are sorted, no later y can gain either
+                        if (position[y] - i) % n < length:
+                            continue  # y is inside the chain
+                        
+                        # Put end right after y, or right before it
+                        for c, d, reverse in ((y, route[(position[y] + 1) % n], reverse_if_before),
+                                              (route[position[y] - 1], y, not reverse_if_before)):
+                            if (position[c] - i) % n < length or (position[d] - i) % n < length:
+                                continue  # The slot touches the chain
+                            if reverse:
+                                added = distance_matrix[c][e] + distance_matrix[s][d]
+                            else:
+                                added = distance_matrix[c][s] + distance_matrix[e][d]
+                            delta = added - distance_matrix[c][d] - removal_gain
+                            if delta < best_delta:
+                                best_delta = delta
+                                best_move = (c, reverse)
+                
+                if best_move is not None:
+                    c, reverse = best_move
+                    # Rotate the chain to the front, cut it out and splice it in after c
+                    rotated = route[i:] + route[:i]
+                    chain, rest = rotated[:length], rotated[length:]
+                    if reverse:
+                        chain.reverse()
+                    k = rest.index(c) + 1
+                    route = rest[:k] + chain + rest[k:]
+                    for j, city in enumerate(route):
+                        position[city] = j
+                    improved = True
+        
+        if not improved:
+            break
+        any_improved = True
+    
+    return route, any_improved
+
+def _local_search_order(order: List[int], distance_matrix: DistanceMatrix,
+                        neighbors: Optional[List[List[int]]] = None) -> List[int]:
+    """
+    Improve a visiting order (as indices) with 2-opt and Or-opt until neither helps.
+    """
+    if neighbors is None:
+        neighbors = _neighbor_lists(distance_matrix)
+    route = order
+    
+    while True:
+        route = _two_opt_order(route, distance_matrix, neighbors=neighbors)
+        route, improved = _or_opt_order(route, distance_matrix, neighbors=neighbors)
+        if not improved:
+            return route
+
+def _seeded_local_search(distance_matrix: DistanceMatrix, neighbors: List[List[int]],
+                         start: int) -> Tuple[float, List[int]]:
+    """
+    Run nearest neighbor from start followed by the local search.
+    
+    Returns:
+        Tuple of (total distance, visiting order as indices)
+    """
+    order = _nearest_neighbor_order(distance_matrix, start)
+    order = _local_search_order(order, distance_matrix, neighbors)
+    return calculate_total_distance(order, distance_matrix), order
+
+# Inputs handed to each pool worker once, instead of with every task
+_worker_inputs = None
+
+def _init_worker(distance_matrix: DistanceMatrix, neighbors: List[List[int]]):
+    global _worker_inputs
+    _worker_inputs = (distance_matrix, neighbors)
+
+def _worker_seeded_local_search(start: int) -> Tuple[float, List[int]]:
+    return _seeded_local_search(*_worker_inputs, start)
+
+def _multi_start_order(distance_matrix: DistanceMatrix, start_count: int = MULTI_START_COUNT) -> List[int]:
     """
-    Find the shortest route using brute force (suitable for small number of points).
+    Return the best visiting order (as indices) over local searches from several starts.
+    
+    The local search only finds a local optimum, and which one depends on the
+    starting tour, so nearest neighbor is seeded from start_count points spread
+    through the input. Independent runs are spread over a process pool when
+    there are enough points to be worth it; the CPU count only decides how
+    many run at once, never which route is returned.
+    """
+    n = len(distance_matrix)
+    start_count = min(start_count, n)
+    starts = [k * n // start_count for k in range(start_count)]
+    neighbors = _neighbor_lists(distance_matrix)
+    workers = min(os.cpu_count() or 1, start_count)
+    
+    if workers > 1 and n >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(distance_matrix, neighbors)) as executor:
+            results = list(executor.map(_worker_seeded_local_search, starts))
+    else:
+        results = [_seeded_local_search(distance_matrix, neighbors, start) for start in starts]
+    
+    return min(results, key=lambda result: result[0])[1]
+
+def find_shortest_route_brute_force(coordinates: List[Tuple[float, float]],
+                                    distance_matrix: Optional[DistanceMatrix] = None) -> List[Tuple[float, float]]:
+    """
+    Find the shortest route exactly (suitable for small number of points).
+    
+    Uses Held-Karp dynamic programming up to HELD_KARP_MAX_POINTS points and
+    branch and bound beyond that.
     
     Args:
         coordinates: List of GPS coordinates as (latitude, longitude) tuples
+        distance_matrix: Optional precomputed matrix from build_distance_matrix
     
     Returns:
         List of coordinates in optimal order
@@ -67,31 +724,28 @@ def find_shortest_route_brute_force(coordinates: List[Tuple[float, float]]) -> L
     if len(coordinates) <= 1:
         return coordinates
     
-    # Fix the first point to avoid duplicate rotations
-    first_point = coordinates[0]
-    remaining_points = coordinates[1:]
+    if distance_matrix is None:
+        distance_matrix = build_distance_matrix(coordinates)
     
-    shortest_distance = float('inf')
-    best_route = coordinates  # Initialize with original coordinates
+    if len(coordinates) <= HELD_KARP_MAX_POINTS:
+        order = _held_karp_order(distance_matrix)
+    else:
+        order = _branch_and_bound_order(distance_matrix)
     
-    # Try all possible permutations of remaining points
-    for perm in itertools.permutations(remaining_points):
-        route = [first_point] + list(perm)
-        distance = calculate_total_distance(route)
-        
-        if distance < shortest_distance:
-            shortest_distance = distance
-            best_route = route
+    return [coordinates[i] for i in order]
 
-    return best_route
-
-def find_shortest_route_nearest_neighbor(coordinates: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+def find_shortest_route_nearest_neighbor(coordinates: List[Tuple[float, float]],
+                                         distance_matrix: Optional[DistanceMatrix] = None) -> List[Tuple[float, float]]:
     """
     Find a good route using nearest neighbor heuristic (suitable for larger number of points).
     This is much faster but may not find the optimal solution.
     
+    Without a precomputed matrix, datasets larger than SPATIAL_INDEX_THRESHOLD
+    use a grid index on projected coordinates instead of building one.
+    
     Args:
         coordinates: List of GPS coordinates as (latitude, longitude) tuples
+        distance_matrix: Optional precomputed matrix from build_distance_matrix
     
     Returns:
         List of coordinates in a good order
@@ -99,16 +753,12 @@ def find_shortest_route_nearest_neighbor(coordinates: List[Tuple[float, float]])
     if len(coordinates) <= 1:
         return coordinates
     
-    unvisited = coordinates.copy()
-    route = [unvisited.pop(0)]  # Start with first coordinate
+    if distance_matrix is None:
+        if len(coordinates) > SPATIAL_INDEX_THRESHOLD:
+            return [coordinates[i] for i in _grid_nearest_neighbor_order(coordinates)]
+        distance_matrix = build_distance_matrix(coordinates)
     
-    while unvisited:
-        current_point = route[-1]
-        nearest_point = min(unvisited, key=lambda p: haversine_distance(current_point, p))
-        route.append(nearest_point)
-        unvisited.remove(nearest_point)
-    
-    return route
+    return [coordinates[i] for i in _nearest_neighbor_order(distance_matrix)]
 
 def two_opt_improvement(route: List[Tuple[float, float]], max_iterations: int = 1000) -> List[Tuple[float, float]]:
     """
@@ -121,55 +771,65 @@ def two_opt_improvement(route: List[Tuple[float, float]], max_iterations: int =
     Returns:
         Improved route
     """
-    best_route = route.copy()
-    best_distance = calculate_total_distance(best_route)
+    distance_matrix = build_distance_matrix(route)
+    order = _two_opt_order(list(range(len(route))), distance_matrix, max_iterations)
     
-    for iteration in range(max_iterations):
-        improved = False
-        
-        for i in range(len(route)):
-            for j in range(i + 2, len(route)):
-                if j == len(route) - 1 and i == 0:
-                    continue  # Skip if it would just reverse the entire route
-                
-                # Create new route by reversing the segment between i and j
-                new_route = route.copy()
-                new_route[i:j+1] = reversed(new_route[i:j+1])
-                
-                new_distance = calculate_total_distance(new_route)
-                
-                if new_distance < best_distance:
-                    best_route = new_route
-                    best_distance = new_distance
-                    route = new_route
-                    improved = True
-                    break
-            
-            if improved:
-                break
-        
-        if not improved:
-            break
+    return [route[i] for i in order]
+
+def find_shortest_route_2opt(coordinates: List[Tuple[float, float]],
+                             distance_matrix: Optional[DistanceMatrix] = None) -> List[Tuple[float, float]]:
+    """
+    Find a good route using nearest neighbor + 2-opt and Or-opt improvement.
+    
+    Runs are made from MULTI_START_COUNT different starting points, in
+    parallel for larger datasets, and the shortest result is kept.
     
-    return best_route
+    Args:
+        coordinates: List of GPS coordinates as (latitude, longitude) tuples
+        distance_matrix: Optional precomputed matrix from build_distance_matrix
+    
+    Returns:
+        List of coordinates in optimized order
+    """
+    if len(coordinates) <= 1:
+        return coordinates
+    
+    if distance_matrix is None:
+        distance_matrix = build_distance_matrix(coordinates)
+    
+    # Start with nearest neighbor solutions and improve them with 2-opt and Or-opt
+    optimized_order = _multi_start_order(distance_matrix)
+    
+    return [coordinates[i] for i in optimized_order]
 
-def find_shortest_route_2opt(coordinates: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+def find_shortest_route_christofides(coordinates: List[Tuple[float, float]],
+                                     distance_matrix: Optional[DistanceMatrix] = None) -> List[Tuple[float, float]]:
     """
-    Find a good route using nearest neighbor + 2-opt improvement.
+    Find a good route using Christofides' construction + 2-opt and Or-opt improvement.
+    
+    The Christofides tour starts the local search much closer to the optimum than nearest
+    neighbor does, so it converges in fewer sweeps to a shorter route.
     
     Args:
         coordinates: List of GPS coordinates as (latitude, longitude) tuples
+        distance_matrix: Optional precomputed matrix from build_distance_matrix
     
     Returns:
         List of coordinates in optimized order
     """
-    # Start with nearest neighbor solution
-    initial_route = find_shortest_route_nearest_neighbor(coordinates)
+    if len(coordinates) <= 1:
+        return coordinates
+    
+    if distance_matrix is None:
+        distance_matrix = build_distance_matrix(coordinates)
+    
+    # Start with Christofides solution
+    initial_order = _christofides_order(distance_matrix)
     
-    # Improve with 2-opt
-    optimized_route = two_opt_improvement(initial_route)
+    # Improve with 2-opt and Or-opt
+    optimized_order = _local_search_order(initial_order, distance_matrix)
     
-    return optimized_route
+    return [coordinates[i] for i in optimized_order]
 
 def optimize_route(coordinates: List[Tuple[float, float]], method: str = "auto") -> Tuple[List[Tuple[float, float]], float]:
     """
@@ -177,7 +837,7 @@ def optimize_route(coordinates: List[Tuple[float, float]], method: str = "auto")
     
     Args:
         coordinates: List of GPS coordinates as (latitude, longitude) tuples
-        method: "brute_force", "nearest_neighbor", "2opt", or "auto"
+        method: "brute_force", "nearest_neighbor", "2opt", "christofides", or "auto"
     
     Returns:
         Tuple of (optimized_route, total_distance)
@@ -189,20 +849,38 @@ def optimize_route(coordinates: List[Tuple[float, float]], method: str = "auto")
         return coordinates, 0
     
     if method == "auto":
-        # Use brute force for very small problems, 2-opt for larger ones
-        if len(coordinates) <= 8:
+        # Use the exact solver for small problems, Christofides + 2-opt for
+        # medium ones, and fall back to the cheaper nearest neighbor seed for
+        # large ones where the Christofides construction gets slow
+        if len(coordinates) <= 15:
             method = "brute_force"
+        elif len(coordinates) <= 500:
+            method = "christofides"
         else:
             method = "2opt"
     
+    if method not in ("brute_force", "nearest_neighbor", "2opt", "christofides"):
+        raise ValueError("Method must be 'brute_force', 'nearest_neighbor', '2opt', 'christofides', or 'auto'")
+    
+    # Compute every pairwise distance once and share it with the solver
+    if method == "nearest_neighbor" and len(coordinates) > SPATIAL_INDEX_THRESHOLD:
+        # Too many points for a full matrix, let the solver use its grid index
+        distance_matrix = None
+    elif method != "brute_force" and _spread_km(coordinates) <= FAST_DISTANCE_MAX_SPREAD_KM:
+        # Heuristics only compare routes, so the cheaper approximation is enough;
+        # the total below is still measured with the exact formula
+        distance_matrix = build_distance_matrix_fast(coordinates)
+    else:
+        distance_matrix = build_distance_matrix(coordinates)
+    
     if method == "brute_force":
-        route = find_shortest_route_brute_force(coordinates)
+        route = find_shortest_route_brute_force(coordinates, distance_matrix)
     elif method == "nearest_neighbor":
-        route = find_shortest_route_nearest_neighbor(coordinates)
+        route = find_shortest_route_nearest_neighbor(coordinates, distance_matrix)
     elif method == "2opt":
-        route = find_shortest_route_2opt(coordinates)
+        route = find_shortest_route_2opt(coordinates, distance_matrix)
     else:
-        raise ValueError("Method must be 'brute_force', 'nearest_neighbor', '2opt', or 'auto'")
+        route = find_shortest_route_christofides(coordinates, distance_matrix)
     
     total_distance = calculate_total_distance(route)
     
@@ -224,6 +902,7 @@ def read_coordinates_from_file(filename: str) -> List[Tuple[float, float]]:
         List of GPS coordinate tuples
     """
     coordinates = []
+    append = coordinates.append
     
     try:
         with open(filename, 'r') as file:
@@ -231,37 +910,30 @@ def read_coordinates_from_file(filename: str) -> List[Tuple[float, float]]:
                 line = line.strip()
                 
                 # Skip empty lines and comments
-                if not line or line.startswith('#'):
+                if not line or line[0] == '#':
+                    continue
+                
+                # Try comma-separated first, then space-separated
+                parts = line.split(',') if ',' in line else line.split()
+                
+                if len(parts) != 2:
+                    print(f"Warning: Line {line_num} has invalid format, skipping: {line}")
                     continue
                 
                 try:
-                    # Try comma-separated first
-                    if ',' in line:
-                        parts = line.split(',')
-                    else:
-                        # Try space-separated
-                        parts = line.split()
-                    
-                    if len(parts) != 2:
-                        print(f"Warning: Line {line_num} has invalid format, skipping: {line}")
-                        continue
-                    
                     lat = float(parts[0].strip())
                     lon = float(parts[1].strip())
-                    
-                    # Basic validation
-                    if not (-90 <= lat <= 90):
-                        print(f"Warning: Line {line_num} has invalid latitude {lat}, skipping")
-                        continue
-                    if not (-180 <= lon <= 180):
-                        print(f"Warning: Line {line_num} has invalid longitude {lon}, skipping")
-                        continue
-                    
-                    coordinates.append((lat, lon))
-                    
                 except ValueError:
                     print(f"Warning: Line {line_num} has invalid number format, skipping: {line}")
                     continue
+                
+                # Basic validation, checked in a single comparison chain for valid lines
+                if -90 <= lat <= 90 and -180 <= lon <= 180:
+                    append((lat, lon))
+                elif not (-90 <= lat <= 90):
+                    print(f"Warning: Line {line_num} has invalid latitude {lat}, skipping")
+                else:
+                    print(f"Warning: Line {line_num} has invalid longitude {lon}, skipping")
                     
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found")
@@ -282,14 +954,14 @@ def write_route_to_file(route: List[Tuple[float, float]], filename: str, total_d
         total_distance: Total distance of the route
     """
     try:
-        with open(filename, 'w') as file:
+        with open(filename, 'w', buffering=1 << 20) as file:
             file.write("# Optimized GPS Route\n")
             file.write(f"# Total distance: {total_distance:.2f} km\n")
             file.write(f"# Number of points: {len(route)}\n")
             file.write("# Format: latitude,longitude\n\n")
             
-            for i, coord in enumerate(route):
-                file.write(f"{coord[0]:.6f},{coord[1]:.6f}\n")
+            # Format every row up front and hand the file a single write
+            file.write("".join(["%.6f,%.6f\n" % (lat, lon) for lat, lon in route]))
         
         print(f"Route saved to '{filename}'")
         
@@ -328,9 +1000,10 @@ Input file format:
   
 Methods:
   auto         - Automatically choose best method (default)
-  brute_force  - Find optimal solution (slow, use for ≤8 points)
+  brute_force  - Find optimal solution (slow, use for ≤15 points)
   nearest_neighbor - Fast heuristic
-  2opt         - Nearest neighbor + 2-opt improvement (good for larger datasets)
+  2opt         - Nearest neighbor + 2-opt/Or-opt improvement (good for larger datasets)
+  christofides - Christofides construction + 2-opt/Or-opt improvement (best for medium datasets)
         """
     )
     
@@ -339,7 +1012,7 @@ Methods:
     parser.add_argument('-o', '--output', 
                        help='Output file for optimized route')
     parser.add_argument('-m', '--method', 
-                       choices=['auto', 'brute_force', 'nearest_neighbor', '2opt'],
+                       choices=['auto', 'brute_force', 'nearest_neighbor', '2opt', 'christofides'],
                        default='auto',
                        help='Optimization method (default: auto)')
     parser.add_argument('-q', '--quiet', action='store_true',